@@ -1,18 +1,31 @@
 from __future__ import annotations
 
+import hashlib
+import inspect
+import io
 import json
 import os
+import pickle
 from pathlib import Path
 import numpy as np
 import pandas as pd
+import matplotlib
+
+matplotlib.use("Agg")  # Render off-screen; skip GUI backend probing
+
 import seaborn as sns
 import matplotlib.pyplot as plt
 from matplotlib.ticker import StrMethodFormatter
 import streamlit as st
 import streamlit_authenticator as stauth
 import gspread
+from gspread.utils import DateTimeOption, ValueRenderOption
 from google.oauth2.service_account import Credentials
 
+# Filtered frames and column selections become lazy copies; data is only
+# duplicated when something actually writes to it
+pd.set_option("mode.copy_on_write", True)
+
 # Google Sheets configuration
 SPREADSHEET_ID = "1dZhNtCPDG2tAzMkd5FpVh1GqtDXeJFEHhVYd2wY12n0"
 SHEET_NAME = "spending-r"
@@ -23,66 +36,177 @@ DATA_FILE = EXPENSES_DIR / "data" / "expenses.csv"
 CREDENTIALS_FILE = APP_DIR / "credentials" / "original-return-107905-3b03bf4c17bf.json"
 
 
-@st.cache_data
-def load_data(use_google_sheets: bool = True) -> pd.DataFrame:
-    if use_google_sheets:
-        # Authenticate with Google Sheets
-        scopes = [
-            "https://www.googleapis.com/auth/spreadsheets.readonly",
-        ]
-
-        # Check for credentials in environment variable (for Railway/cloud deployment)
-        credentials_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
-        if credentials_json:
-            # Parse JSON from environment variable
-            credentials_info = json.loads(credentials_json)
-            creds = Credentials.from_service_account_info(credentials_info, scopes=scopes)
-        else:
-            # Fall back to file-based credentials (for local development)
-            creds = Credentials.from_service_account_file(
-                str(CREDENTIALS_FILE), scopes=scopes
-            )
+@st.cache_resource
+def _gs_client() -> gspread.Client:
+    # Authenticate with Google Sheets once per process
+    scopes = [
+        "https://www.googleapis.com/auth/spreadsheets.readonly",
+    ]
 
-        client = gspread.authorize(creds)
+    # Check for credentials in environment variable (for Railway/cloud deployment)
+    credentials_json = os.getenv("GOOGLE_CREDENTIALS_JSON")
+    if credentials_json:
+        # Parse JSON from environment variable
+        credentials_info = json.loads(credentials_json)
+        creds = Credentials.from_service_account_info(credentials_info, scopes=scopes)
+    else:
+        # Fall back to file-based credentials (for local development)
+        creds = Credentials.from_service_account_file(
+            str(CREDENTIALS_FILE), scopes=scopes
+        )
 
-        # Open the spreadsheet and get the data
-        sheet = client.open_by_key(SPREADSHEET_ID).worksheet(SHEET_NAME)
-        data = sheet.get(SHEET_RANGE)
+    return gspread.authorize(creds)
 
-        # Convert to DataFrame (first row is headers)
-        df = pd.DataFrame(data[1:], columns=data[0])
-    else:
-        # Fallback to CSV
-        df = pd.read_csv(DATA_FILE, encoding="utf-8-sig")
 
+@st.cache_data(ttl=600)
+def _fetch_raw_sheet() -> tuple[str, tuple[tuple[object, ...], ...]]:
+    # Open the spreadsheet and get the data as raw values (dates as serial numbers)
+    sheet = _gs_client().open_by_key(SPREADSHEET_ID).worksheet(SHEET_NAME)
+    data = sheet.get(
+        SHEET_RANGE,
+        value_render_option=ValueRenderOption.unformatted,
+        date_time_render_option=DateTimeOption.serial_number,
+    )
+
+    # Digest the payload once here so _clean's cache key is a short string
+    # rather than every cell hashed by Streamlit on each rerun
+    rows = tuple(tuple(row) for row in data)
+    digest = hashlib.md5(pickle.dumps(rows)).hexdigest()
+    return digest, rows
+
+
+def _prepare(df: pd.DataFrame) -> pd.DataFrame:
     df.columns = [c.strip() for c in df.columns]
+    # Only these source columns are used downstream; drop the rest up front
+    df = df.drop(columns=df.columns.difference(["date", "type", "category", "amount"]))
     df["date"] = pd.to_datetime(df["date"], errors="coerce")
     df["amount"] = pd.to_numeric(df["amount"], errors="coerce")
 
+    # Normalize type and category once; later comparisons run on category codes
+    df["type"] = df["type"].astype("string").str.upper().astype("category")
+    df["category"] = (
+        df["category"]
+        .fillna("(uncategorized)")
+        .astype(str)
+        .str.strip()
+        .str.lower()
+        .astype("category")
+    )
+
+    # Spend should be positive
+    df["spend"] = -df["amount"]
+
+    # Derive month start
+    month = df["date"].dt.to_period("M")
+    df["month_start"] = month.dt.to_timestamp()
+
     # Keep only months that have data through at least the 25th
-    df["month"] = df["date"].dt.to_period("M")
-    coverage_months = (
-        df.groupby("month")["date"].max().dt.day >= 25
-    ).loc[lambda s: s].index
-    df = df[df["month"].isin(coverage_months)].copy()
+    month_max = (
+        df["date"].groupby(month.astype("category"), observed=True).transform("max")
+    )
 
     # Keep only expenses, filter out internal transfers/payments
-    df = df[df["type"].str.upper() == "DEBIT"].copy()
     excluded_categories = {"transfer/pmt", "investment", "rental inc"}
-    df = df[
-        ~df["category"].astype(str).str.strip().str.lower().isin(excluded_categories)
-    ].copy()
+    keep = (
+        (month_max.dt.day >= 25)
+        & (df["type"] == "DEBIT")
+        & ~df["category"].isin(excluded_categories)
+    )
+    return df.loc[keep]
 
-    # Spend should be positive
-    df["spend"] = -df["amount"]
 
-    # Derive month start
-    df["month_start"] = df["date"].dt.to_period("M").dt.to_timestamp()
+# Streamlit keys _clean on its own source only; include _prepare's source so
+# edits to the cleaning rules don't reload a stale frame from the disk cache
+_PREPARE_KEY = hashlib.md5(inspect.getsource(_prepare).encode()).hexdigest()
 
-    # Normalize category
-    df["category"] = df["category"].fillna("(uncategorized)").str.strip().str.lower()
 
-    return df
+@st.cache_data(persist="disk", max_entries=8)
+def _clean(
+    digest: str, prepare_key: str, _raw: tuple[tuple[object, ...], ...]
+) -> pd.DataFrame:
+    # Keyed on the payload digest and cleaning code; _raw itself is not hashed
+    # Convert to DataFrame (first row is headers)
+    df = pd.DataFrame(list(_raw[1:]), columns=[str(c).strip() for c in _raw[0]])
+    # Sheets serial dates count days from 1899-12-30; cells stored as text
+    # come back as strings, so parse those the usual way
+    serial = pd.to_numeric(df["date"], errors="coerce")
+    df["date"] = pd.to_datetime(
+        serial, unit="D", origin=pd.Timestamp("1899-12-30")
+    ).fillna(pd.to_datetime(df["date"].where(serial.isna()), errors="coerce"))
+    return _prepare(df)
+
+
+@st.cache_data
+def _load_csv() -> pd.DataFrame:
+    return _prepare(pd.read_csv(DATA_FILE, engine="pyarrow", encoding="utf-8-sig"))
+
+
+def load_data(use_google_sheets: bool = True) -> pd.DataFrame:
+    if use_google_sheets:
+        digest, raw = _fetch_raw_sheet()
+        return _clean(digest, _PREPARE_KEY, raw)
+    # Fallback to CSV
+    return _load_csv()
+
+
+@st.cache_data(max_entries=32)
+def _aggregate(
+    df_key: bytes, _df: pd.DataFrame
+) -> tuple[pd.DataFrame, pd.DataFrame, pd.DataFrame, pd.DataFrame]:
+    # Keyed on the filtered frame's content hash; _df itself is not hashed
+    pivot_corr = _df.pivot_table(
+        index="month_start",
+        columns="category",
+        values="spend",
+        aggfunc="sum",
+        observed=True,
+    ).sort_index()
+    pivot = pivot_corr.fillna(0)
+    monthly_spend = pivot.sum(axis=1).rename("spend").reset_index()
+    category_total = (
+        pivot.sum().sort_values(ascending=False).rename("spend").reset_index()
+    )
+    return monthly_spend, category_total, pivot, pivot_corr
+
+
+@st.cache_data(max_entries=32)
+def _pairwise_corr(data: pd.DataFrame) -> pd.DataFrame:
+    # Pearson correlation over pairwise-complete months, same as DataFrame.corr(),
+    # built from a handful of matrix products instead of per-pair column loops
+    values = data.to_numpy(dtype=float)
+    present = ~np.isnan(values)
+    m = present.astype(float)
+    raw = np.where(present, values, 0.0)
+    # Centre each column first so the single-pass sums stay well conditioned
+    x = np.where(present, values - np.nanmean(values, axis=0), 0.0)
+    n = m.T @ m
+    sum_x = x.T @ m
+    sum_sq = (x * x).T @ m
+    cross = x.T @ x
+    scale = (raw * raw).T @ m
+    with np.errstate(divide="ignore", invalid="ignore"):
+        cov = n * cross - sum_x * sum_x.T
+        var = n * sum_sq - sum_x**2
+        corr = cov / np.sqrt(var * var.T)
+    # Fixed monthly spend (rent, subscriptions) has zero variance; rounding
+    # leaves a tiny residue there, so treat it as undefined like pandas does
+    flat = var <= 1e-10 * n * scale
+    corr[flat | flat.T | (n < 2)] = np.nan
+    return pd.DataFrame(corr, index=data.columns, columns=data.columns)
+
+
+@st.cache_data(max_entries=32)
+def _histogram(
+    spend: tuple[float, ...], bin_size: int
+) -> tuple[np.ndarray, np.ndarray]:
+    if not spend:
+        return np.array([]), np.array([], dtype=int)
+    values = np.asarray(spend, dtype=float)
+    min_val = (values.min() // bin_size) * bin_size
+    max_val = ((values.max() // bin_size) + 1) * bin_size
+    edges = np.arange(min_val, max_val + bin_size, bin_size)
+    counts, _ = np.histogram(values, bins=edges)
+    return edges, counts
 
 
 def currency_axes(ax: plt.Axes, axis: str = "y") -> None:
@@ -93,6 +217,135 @@ def currency_axes(ax: plt.Axes, axis: str = "y") -> None:
         ax.xaxis.set_major_formatter(formatter)
 
 
+def _fig_to_png(fig: plt.Figure) -> bytes:
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", dpi=200, bbox_inches="tight")
+    plt.close(fig)
+    return buf.getvalue()
+
+
+@st.cache_data(max_entries=32)
+def _monthly_spend_png(monthly_spend: pd.DataFrame) -> bytes:
+    fig, ax = plt.subplots(figsize=(5.5, 3))
+    ax.plot(monthly_spend["month_start"], monthly_spend["spend"], marker="o")
+    ax.set_title("Monthly Spend")
+    ax.tick_params(axis="x", rotation=45)
+    currency_axes(ax, axis="y")
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def _top_categories_png(category_total: pd.DataFrame) -> bytes:
+    fig, ax = plt.subplots(figsize=(5.5, 3.5))
+    ax.barh(category_total["category"].astype(str), category_total["spend"])
+    ax.invert_yaxis()
+    ax.set_title("Top 12 Categories by Spend")
+    currency_axes(ax, axis="x")
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def _top_categories_by_month_png(pivot_top: pd.DataFrame) -> bytes:
+    fig, ax = plt.subplots(figsize=(10, 3.6))
+    pivot_top.plot(kind="bar", stacked=True, ax=ax)
+    ax.set_title("Monthly Spend by Top Categories")
+    ax.tick_params(axis="x", rotation=45)
+    currency_axes(ax, axis="y")
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    legend = ax.get_legend()
+    if legend:
+        legend.set_title("")
+        legend.set_bbox_to_anchor((0, 1))
+        legend._loc = 2
+        for text in legend.get_texts():
+            text.set_fontsize(7)
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def _spend_distribution_png(
+    edges: np.ndarray, counts: np.ndarray, bin_size: int
+) -> bytes:
+    fig, ax = plt.subplots(figsize=(5.5, 3))
+    if counts.size:
+        ax.bar(
+            edges[:-1],
+            counts,
+            width=bin_size,
+            align="edge",
+            color="#4C78A8",
+            edgecolor="white",
+        )
+    ax.set_title("Distribution of Monthly Spend")
+    if edges.size > 1:
+        ax.set_xticks(np.arange(edges[0], edges[-1] + 1, 4000))
+    currency_axes(ax, axis="x")
+    ax.set_xlabel("Monthly Spend")
+    ax.set_ylabel("Months")
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def _spend_range_png(pivot_box: pd.DataFrame) -> bytes:
+    box_values = pivot_box.to_numpy(dtype=float)
+    box_data = [col[~np.isnan(col)] for col in box_values.T]
+    fig, ax = plt.subplots(figsize=(5.5, 3.5))
+    ax.boxplot(
+        box_data,
+        labels=pivot_box.columns.astype(str).tolist(),
+        vert=False,
+        patch_artist=True,
+    )
+    ax.set_title("Monthly Spend Range by Top Categories")
+    currency_axes(ax, axis="x")
+    ax.set_xlabel("")
+    ax.set_ylabel("")
+    return _fig_to_png(fig)
+
+
+@st.cache_data(max_entries=32)
+def _correlation_heatmap_png(corr_plot: pd.DataFrame, diag_mask: np.ndarray) -> bytes:
+    cmap = sns.color_palette("vlag", as_cmap=True)
+    cmap.set_bad("black")
+    # Draw the mesh directly rather than through sns.heatmap's wrapper
+    labels = corr_plot.columns.astype(str).tolist()
+    ticks = np.arange(len(labels)) + 0.5
+    values = np.ma.masked_where(diag_mask, corr_plot.to_numpy(dtype=float))
+    fig, ax = plt.subplots(figsize=(6.2, 3.6))
+    mesh = ax.pcolormesh(
+        values,
+        cmap=cmap,
+        vmin=-1,
+        vmax=1,
+        edgecolors="#f0f0f0",
+        linewidth=0.5,
+    )
+    ax.set_xlim(0, len(labels))
+    ax.set_ylim(len(labels), 0)
+    ax.set_aspect("equal")
+    for spine in ax.spines.values():
+        spine.set_visible(False)
+    ax.set_title("Monthly Spend Correlation by Category")
+    ax.set_xticks(ticks)
+    ax.set_xticklabels(
+        labels, rotation=45, ha="right", rotation_mode="anchor", fontsize=7
+    )
+    ax.set_yticks(ticks)
+    ax.set_yticklabels(labels, fontsize=7)
+    ax.set_xlabel("Category", fontsize=8)
+    ax.set_ylabel("Category", fontsize=8)
+    cbar = fig.colorbar(mesh, ax=ax, shrink=0.75)
+    cbar.ax.tick_params(labelsize=7)
+    cbar.set_label("Correlation", fontsize=8)
+    fig.tight_layout()
+    return _fig_to_png(fig)
+
+
 def main() -> None:
     st.set_page_config(page_title="Expenses Explorer", layout="wide")
 
@@ -174,21 +427,28 @@ def main() -> None:
             "Categories", categories, default=categories
         )
 
+    # Apply date and category filters in a single pass
+    mask = pd.Series(True, index=df.index)
     if isinstance(date_range, tuple) and len(date_range) == 2:
         start_date, end_date = date_range
-        mask = (df["date"].dt.date >= start_date) & (df["date"].dt.date <= end_date)
-        df = df[mask].copy()
+        start = np.datetime64(start_date)
+        end = np.datetime64(end_date) + np.timedelta64(1, "D")
+        dates = df["date"].to_numpy()
+        mask &= (dates >= start) & (dates < end)
 
     if selected_categories:
-        df = df[df["category"].isin(selected_categories)].copy()
+        mask &= df["category"].isin(selected_categories)
+
+    df = df.loc[mask]
 
     if df.empty:
         st.warning("No data available for the selected filters.")
         return
 
     # Summary
+    df_key = pd.util.hash_pandas_object(df, index=False).to_numpy().tobytes()
+    monthly_spend, category_total, pivot, pivot_corr = _aggregate(df_key, df)
     total_spend = df["spend"].sum()
-    monthly_spend = df.groupby("month_start", as_index=False)["spend"].sum()
     avg_monthly_spend = monthly_spend["spend"].mean()
 
     col1, col2, col3 = st.columns(3)
@@ -199,178 +459,100 @@ def main() -> None:
     col_left, col_right = st.columns(2)
     with col_left:
         st.subheader("Monthly Spend")
-        fig, ax = plt.subplots(figsize=(5.5, 3))
-        ax.plot(monthly_spend["month_start"], monthly_spend["spend"], marker="o")
-        ax.set_title("Monthly Spend")
-        ax.tick_params(axis="x", rotation=45)
-        currency_axes(ax, axis="y")
-        ax.set_xlabel("")
-        ax.set_ylabel("")
-        st.pyplot(fig, clear_figure=True, use_container_width=True)
+        st.image(_monthly_spend_png(monthly_spend), use_container_width=True)
 
     with col_right:
         st.subheader("Top Categories")
-        category_total = (
-            df.groupby("category", as_index=False)["spend"].sum().sort_values("spend", ascending=False)
+        st.image(
+            _top_categories_png(category_total.head(12)), use_container_width=True
         )
-        fig, ax = plt.subplots(figsize=(5.5, 3.5))
-        ax.barh(category_total.head(12)["category"], category_total.head(12)["spend"])
-        ax.invert_yaxis()
-        ax.set_title("Top 12 Categories by Spend")
-        currency_axes(ax, axis="x")
-        ax.set_xlabel("")
-        ax.set_ylabel("")
-        st.pyplot(fig, clear_figure=True, use_container_width=True)
 
     st.subheader("Monthly Spend by Top Categories")
-    category_total = (
-        df.groupby("category", as_index=False)["spend"].sum().sort_values("spend", ascending=False)
-    )
-    category_month = (
-        df.groupby(["month_start", "category"], as_index=False)["spend"].sum()
-    )
-    pivot = (
-        category_month.pivot(index="month_start", columns="category", values="spend")
-        .fillna(0)
-    )
     top_cats = category_total.head(6)["category"].tolist()
-    pivot_top = pivot[top_cats].copy()
+    pivot_top = pivot[top_cats]
     pivot_top.index = pivot_top.index.to_period("M").astype(str)
-
-    fig, ax = plt.subplots(figsize=(10, 3.6))
-    pivot_top.plot(kind="bar", stacked=True, ax=ax)
-    ax.set_title("Monthly Spend by Top Categories")
-    ax.tick_params(axis="x", rotation=45)
-    currency_axes(ax, axis="y")
-    ax.set_xlabel("")
-    ax.set_ylabel("")
-    legend = ax.get_legend()
-    if legend:
-        legend.set_title("")
-        legend.set_bbox_to_anchor((0, 1))
-        legend._loc = 2
-        for text in legend.get_texts():
-            text.set_fontsize(7)
-    st.pyplot(fig, clear_figure=True, use_container_width=True)
+    st.image(_top_categories_by_month_png(pivot_top), use_container_width=True)
 
     # Additional charts
     dist_col, range_col = st.columns(2)
 
     with dist_col:
         st.subheader("Monthly Spend Distribution")
-        spend_vals = monthly_spend["spend"].dropna()
-        if not spend_vals.empty:
-            bin_size = 2000
-            min_val = (spend_vals.min() // bin_size) * bin_size
-            max_val = ((spend_vals.max() // bin_size) + 1) * bin_size
-            bins = np.arange(min_val, max_val + bin_size, bin_size)
-        else:
-            bins = 12
-        fig, ax = plt.subplots(figsize=(5.5, 3))
-        ax.hist(spend_vals, bins=bins, color="#4C78A8", edgecolor="white")
-        ax.set_title("Distribution of Monthly Spend")
-        if isinstance(bins, np.ndarray) and bins.size > 1:
-            ax.set_xticks(np.arange(bins[0], bins[-1] + 1, 4000))
-        currency_axes(ax, axis="x")
-        ax.set_xlabel("Monthly Spend")
-        ax.set_ylabel("Months")
-        st.pyplot(fig, clear_figure=True, use_container_width=True)
+        bin_size = 2000
+        edges, counts = _histogram(
+            tuple(monthly_spend["spend"].dropna().tolist()), bin_size
+        )
+        st.image(
+            _spend_distribution_png(edges, counts, bin_size), use_container_width=True
+        )
 
     with range_col:
         st.subheader("Monthly Spend Range by Category")
         top_cats_box = category_total.head(10)["category"].tolist()
-        box_data = [
-            pivot.get(cat).dropna().values if cat in pivot.columns else []
-            for cat in top_cats_box
-        ]
-        fig, ax = plt.subplots(figsize=(5.5, 3.5))
-        ax.boxplot(box_data, labels=top_cats_box, vert=False, patch_artist=True)
-        ax.set_title("Monthly Spend Range by Top Categories")
-        currency_axes(ax, axis="x")
-        ax.set_xlabel("")
-        ax.set_ylabel("")
-        st.pyplot(fig, clear_figure=True, use_container_width=True)
+        st.image(
+            _spend_range_png(pivot.reindex(columns=top_cats_box)),
+            use_container_width=True,
+        )
 
     st.subheader("Tables")
-    monthly = monthly_spend.copy()
-    monthly["month_start"] = monthly["month_start"].dt.date
-    monthly["mom_change"] = monthly["spend"].diff()
-    monthly["mom_change_pct"] = monthly["spend"].pct_change() * 100
+    monthly = monthly_spend.assign(
+        month_start=monthly_spend["month_start"].dt.date,
+        mom_change=monthly_spend["spend"].diff(),
+        mom_change_pct=monthly_spend["spend"].pct_change() * 100,
+    )
 
     tbl_left, tbl_right = st.columns(2)
     with tbl_left:
         st.markdown("**Monthly**")
         st.dataframe(
-            monthly.style.format({
-                "spend": "${:,.0f}",
-                "mom_change": "${:,.0f}",
-                "mom_change_pct": "{:,.0f}%",
-            })
+            monthly.assign(
+                spend=monthly["spend"].map("${:,.0f}".format, na_action="ignore"),
+                mom_change=monthly["mom_change"].map(
+                    "${:,.0f}".format, na_action="ignore"
+                ),
+                mom_change_pct=monthly["mom_change_pct"].map(
+                    "{:,.0f}%".format, na_action="ignore"
+                ),
+            )
         )
 
     with tbl_right:
         st.markdown("**Top Categories**")
-        st.dataframe(category_total.head(10).style.format({"spend": "${:,.0f}"}))
+        top_categories = category_total.head(10)
+        st.dataframe(
+            top_categories.assign(
+                spend=top_categories["spend"].map("${:,.0f}".format)
+            )
+        )
 
     # Correlation heatmap
     st.subheader("Category Correlations")
     heat_left, heat_mid, heat_right = st.columns([1, 2, 1])
-    monthly_cat_corr = (
-        df.groupby(["month_start", "category"], as_index=False)["spend"].sum()
-    )
-    pivot_corr = (
-        monthly_cat_corr.pivot(index="month_start", columns="category", values="spend")
-        .sort_index()
-    )
     min_months = 4
     eligible = pivot_corr.count() >= min_months
     corr_data = pivot_corr.loc[:, eligible]
     corr_summary: list[str] = []
     if corr_data.shape[1] >= 2:
-        corr = corr_data.corr()
-        corr_plot = corr.fillna(0).copy()
-        diag_mask = np.eye(corr_plot.shape[0], dtype=bool)
-        corr_plot.values[diag_mask] = np.nan
-        cmap = sns.color_palette("vlag", as_cmap=True)
-        cmap.set_bad("black")
-        fig, ax = plt.subplots(figsize=(6.2, 3.6))
-        sns.heatmap(
-            corr_plot,
-            ax=ax,
-            cmap=cmap,
-            vmin=-1,
-            vmax=1,
-            center=0,
-            square=True,
-            linewidths=0.5,
-            linecolor="#f0f0f0",
-            mask=diag_mask,
-            cbar_kws={"label": "Correlation", "shrink": 0.75},
-        )
-        ax.set_title("Monthly Spend Correlation by Category")
-        ax.tick_params(axis="x", labelrotation=45, labelsize=7)
-        ax.set_xticklabels(ax.get_xticklabels(), ha="right", rotation_mode="anchor")
-        ax.tick_params(axis="y", labelsize=7)
-        ax.set_xlabel("Category", fontsize=8)
-        ax.set_ylabel("Category", fontsize=8)
-        fig.tight_layout()
+        corr = _pairwise_corr(corr_data)
+        diag_mask = np.eye(corr.shape[0], dtype=bool)
+        corr_plot = corr.fillna(0).mask(diag_mask)
         st.caption(
             f"Based on {corr_data.shape[0]} months. "
             f"Showing categories with at least {min_months} months of data."
         )
         with heat_mid:
-            cbar = ax.collections[0].colorbar
-            cbar.ax.tick_params(labelsize=7)
-            cbar.set_label("Correlation", fontsize=8)
-            st.pyplot(fig, clear_figure=True, use_container_width=False)
-
-        corr_pairs = corr.where(~np.eye(corr.shape[0], dtype=bool))
-        corr_stack = corr_pairs.stack().sort_values()
-        if not corr_stack.empty:
-            strongest_neg = corr_stack.iloc[0]
-            strongest_pos = corr_stack.iloc[-1]
-            neg_pair = corr_stack.index[0]
-            pos_pair = corr_stack.index[-1]
+            st.image(_correlation_heatmap_png(corr_plot, diag_mask))
+
+        # Scan the upper triangle for the extremes instead of stacking and sorting
+        corr_pairs = corr.to_numpy(dtype=float, copy=True)
+        corr_pairs[np.tril_indices(corr_pairs.shape[0])] = np.nan
+        if not np.isnan(corr_pairs).all():
+            neg_i, neg_j = np.unravel_index(np.nanargmin(corr_pairs), corr_pairs.shape)
+            pos_i, pos_j = np.unravel_index(np.nanargmax(corr_pairs), corr_pairs.shape)
+            strongest_neg = corr_pairs[neg_i, neg_j]
+            strongest_pos = corr_pairs[pos_i, pos_j]
+            neg_pair = (corr.index[neg_i], corr.columns[neg_j])
+            pos_pair = (corr.index[pos_i], corr.columns[pos_j])
             corr_summary.append(
                 f"Strongest negative correlation: "
                 f"{neg_pair[0]} vs {neg_pair[1]} "
@@ -404,13 +586,7 @@ def main() -> None:
             f"({top_share:,.0f}% of spend)."
         )
 
-    monthly_cat = (
-        df.groupby(["month_start", "category"], as_index=False)["spend"].sum()
-    )
-    pivot_cat = (
-        monthly_cat.pivot(index="month_start", columns="category", values="spend")
-        .sort_index()
-    )
+    pivot_cat = pivot_corr
     valid_cats = pivot_cat.count() >= 2
     if valid_cats.any():
         range_by_cat = (pivot_cat.max() - pivot_cat.min()).loc[valid_cats]
@@ -423,14 +599,18 @@ def main() -> None:
 
         var_cat_range = range_by_cat.idxmax()
         var_range = range_by_cat.max()
-        pct_change = (
-            pivot_cat.pct_change()
-            .replace([np.inf, -np.inf], np.nan)
-            .abs()
-        )
-        max_pct_by_cat = pct_change.max().loc[valid_cats]
-        var_cat_pct = max_pct_by_cat.idxmax()
-        var_pct = max_pct_by_cat.max() * 100
+        # Largest absolute MoM % change per category in one ndarray pass;
+        # gaps are forward-filled and changes from a zero month are ignored
+        spend_by_month = pivot_cat.ffill().to_numpy(dtype=float)
+        prev, curr = spend_by_month[:-1], spend_by_month[1:]
+        with np.errstate(divide="ignore", invalid="ignore"):
+            pct_change = np.abs((curr - prev) / prev)
+        pct_change[~np.isfinite(pct_change)] = np.nan
+        max_pct_by_cat = np.fmax.reduce(pct_change, axis=0)
+        max_pct_by_cat[~valid_cats.to_numpy()] = np.nan
+        var_col = int(np.argmax(np.nan_to_num(max_pct_by_cat, nan=-1.0)))
+        var_cat_pct = pivot_cat.columns[var_col]
+        var_pct = max_pct_by_cat[var_col] * 100
         insights.append(
             f"Most variable category: '{var_cat_range}' with a ${var_range:,.0f} range; "
             f"largest MoM % change in '{var_cat_pct}' at {var_pct:,.0f}%."
@@ -1,11 +1,14 @@
 """Utility script to generate hashed password for streamlit-authenticator"""
+import os
+
 import bcrypt
 
 print("Generate hashed password for streamlit-authenticator")
 print("=" * 50)
 
 password = input("Enter password to hash: ")
-hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
 
 print(f"\nHashed password:\n{hashed}")
 print("\nAdd this to your Railway environment variables as AUTH_PASSWORD_HASH")
@@ -1,9 +1,12 @@
 """Generate a password hash for testing"""
+import os
+
 import bcrypt
 
 # Generate hash for password 'testpass123'
 password = 'testpass123'
-hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt()).decode()
+rounds = int(os.getenv("BCRYPT_ROUNDS", "12"))
+hashed = bcrypt.hashpw(password.encode(), bcrypt.gensalt(rounds=rounds)).decode()
 print(f"Password: {password}")
 print(f"Hash: {hashed}")
 print("\nSet this as AUTH_PASSWORD_HASH environment variable")
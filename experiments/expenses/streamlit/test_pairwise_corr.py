@@ -0,0 +1,31 @@
+"""Check that the app's pairwise correlation matches DataFrame.corr()"""
+import numpy as np
+import pandas as pd
+
+from app import _pairwise_corr
+
+
+def test_pairwise_corr_matches_pandas_with_constant_columns() -> None:
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame(
+        {
+            # Fixed monthly spend: zero variance, correlation is undefined
+            "rent": [1850.0] * 12,
+            "sub": [15.99] * 12,
+            "ins": [123.45] * 10 + [np.nan] * 2,
+            # Varying spend, with gaps so pairs cover different months
+            "food": rng.normal(900, 150, 12),
+            "travel": np.r_[rng.normal(400, 300, 9), [np.nan] * 3],
+            "shopping": np.r_[[np.nan] * 2, rng.normal(250, 80, 10)],
+        }
+    )
+    expected = data.corr()
+    actual = _pairwise_corr(data)
+    np.testing.assert_allclose(
+        actual.to_numpy(), expected.to_numpy(), rtol=1e-9, atol=1e-12, equal_nan=True
+    )
+
+
+if __name__ == "__main__":
+    test_pairwise_corr_matches_pandas_with_constant_columns()
+    print("✓ _pairwise_corr matches DataFrame.corr()")
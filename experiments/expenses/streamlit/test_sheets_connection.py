@@ -2,6 +2,7 @@
 from pathlib import Path
 
 import gspread
+from gspread.utils import DateTimeOption, ValueRenderOption
 from google.oauth2.service_account import Credentials
 
 SPREADSHEET_ID = "1dZhNtCPDG2tAzMkd5FpVh1GqtDXeJFEHhVYd2wY12n0"
@@ -22,11 +23,31 @@ try:
     sheet = client.open_by_key(SPREADSHEET_ID).worksheet(SHEET_NAME)
 
     print(f"Reading range {SHEET_RANGE}...")
-    data = sheet.get(SHEET_RANGE)
+    data = sheet.get(
+        SHEET_RANGE,
+        value_render_option=ValueRenderOption.unformatted,
+        date_time_render_option=DateTimeOption.serial_number,
+    )
 
     print(f"✓ Success! Retrieved {len(data)} rows")
     print(f"✓ Headers: {data[0][:5]}...")  # Show first 5 headers
     print(f"✓ Sample row: {data[1][:5]}...")  # Show first 5 columns of first data row
 
+    # Dates should arrive as serial numbers; text-formatted cells come back as strings
+    date_idx = [str(h).strip() for h in data[0]].index("date")
+    date_cells = [row[date_idx] for row in data[1:] if len(row) > date_idx]
+    serial_dates = sum(
+        isinstance(cell, (int, float)) and not isinstance(cell, bool)
+        for cell in date_cells
+    )
+    text_dates = sum(isinstance(cell, str) and cell.strip() != "" for cell in date_cells)
+    blank_dates = sum(
+        cell is None or (isinstance(cell, str) and cell.strip() == "")
+        for cell in date_cells
+    )
+    print(
+        f"✓ Date cells: {serial_dates} serial, {text_dates} text, {blank_dates} blank"
+    )
+
 except Exception as e:
     print(f"✗ Error: {e}")